@@ -11,11 +11,13 @@ load_dotenv()
 
 # ── Telegram ──────────────────────────────────────────────────────────────────
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
-ALLOWED_USER_IDS = [
+# Only these Telegram user IDs can interact with the bot.
+# frozenset → O(1) membership check in is_authorized() on every update.
+ALLOWED_USER_IDS = frozenset(
     int(uid.strip())
     for uid in os.getenv("ALLOWED_USER_IDS", "").split(",")
     if uid.strip()
-]  # Only these Telegram user IDs can interact with the bot
+)
 
 # ── Gemini AI ─────────────────────────────────────────────────────────────────
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
@@ -34,11 +36,21 @@ NEWS_FETCH_INTERVAL_MIN = 15
 
 # ── RSS / YouTube Channels (add channel IDs here) ────────────────────────────
 # To find a channel ID: go to the channel → view page source → search "channel_id"
-YOUTUBE_CHANNEL_IDS = os.getenv("YOUTUBE_CHANNEL_IDS", "").split(",")
-# Example: ["UCVHFbw7woebKtfT3s8T4Hcg", "UC-lHJZR3Gqxm24_Vd_AJ5Yw"]
+# Parsed (split/strip/filter) exactly once at import; tuples so nothing
+# downstream can mutate or re-parse them.
+YOUTUBE_CHANNEL_IDS = tuple(
+    cid.strip()
+    for cid in os.getenv("YOUTUBE_CHANNEL_IDS", "").split(",")
+    if cid.strip()
+)
+# Example: ("UCVHFbw7woebKtfT3s8T4Hcg", "UC-lHJZR3Gqxm24_Vd_AJ5Yw")
 
-CUSTOM_RSS_FEEDS = os.getenv("CUSTOM_RSS_FEEDS", "").split(",")
-# Example: ["https://feeds.bbci.co.uk/news/rss.xml", "https://techcrunch.com/feed/"]
+CUSTOM_RSS_FEEDS = tuple(
+    url.strip()
+    for url in os.getenv("CUSTOM_RSS_FEEDS", "").split(",")
+    if url.strip()
+)
+# Example: ("https://feeds.bbci.co.uk/news/rss.xml", "https://techcrunch.com/feed/")
 
 # ── Breaking News Keywords ────────────────────────────────────────────────────
 BREAKING_KEYWORDS = [
@@ -54,5 +66,12 @@ NEWS_CATEGORIES = [
     "Stock & Market", "Business", "Health", "Environment"
 ]
 
+# ── Webhook (optional) ────────────────────────────────────────────────────────
+# Set WEBHOOK_URL to the public HTTPS address Telegram should push updates
+# to (e.g. https://bot.example.com). Leave empty to use long polling.
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+
 # ── Logging ───────────────────────────────────────────────────────────────────
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -15,7 +15,7 @@ if sys.platform == "win32":
 from src.bot.telegram_bot import build_app
 from src.scheduler.scheduler import attach_scheduler
 from src.database.db import init_db
-from config.settings import LOG_LEVEL
+from config.settings import LOG_LEVEL, WEBHOOK_URL, WEBHOOK_PORT, WEBHOOK_SECRET
 
 os.makedirs("logs", exist_ok=True)
 
@@ -37,9 +37,21 @@ def main():
     app = build_app()
     attach_scheduler(app)
 
-    logger.info("Telegram Bot is starting. Polling for messages...")
-    # run_polling manages its own event loop - do NOT wrap in asyncio.run()
-    app.run_polling(drop_pending_updates=True)
+    if WEBHOOK_URL:
+        # Telegram pushes updates straight to us - no long-poll round trip
+        # on the critical path. run_webhook manages its own event loop.
+        logger.info(f"Telegram Bot is starting. Webhook at {WEBHOOK_URL}...")
+        app.run_webhook(
+            listen="0.0.0.0",
+            port=WEBHOOK_PORT,
+            webhook_url=WEBHOOK_URL,
+            secret_token=WEBHOOK_SECRET or None,
+            drop_pending_updates=True
+        )
+    else:
+        logger.info("Telegram Bot is starting. Polling for messages...")
+        # run_polling manages its own event loop - do NOT wrap in asyncio.run()
+        app.run_polling(drop_pending_updates=True)
 
 
 if __name__ == "__main__":
@@ -3,97 +3,278 @@ src/bot/telegram_bot.py
 
 """
 
+import asyncio
+import functools
 import logging
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand # type: ignore
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup # type: ignore
 from telegram.ext import ( # type: ignore
-    Application, CommandHandler, CallbackQueryHandler,
+    AIORateLimiter, Application, CommandHandler, CallbackQueryHandler,
     MessageHandler, ContextTypes, filters
 )
 from telegram.constants import ParseMode # type: ignore
+from telegram.error import RetryAfter # type: ignore
+from telegram.request import HTTPXRequest # type: ignore
 
 from config.settings import TELEGRAM_BOT_TOKEN, ALLOWED_USER_IDS, NEWS_CATEGORIES
-from src.processors.ai_processor import summarize_custom_query
-from src.processors.message_formatter import format_category_update
-from src.database.db import init_db
+from src.processors.ai_processor import (
+    summarize_custom_query, batch_summarize, clear_query_cache
+)
+from src.processors.message_formatter import (
+    format_category_update, format_evening_digest, format_youtube_update
+)
+from src.database.db import (
+    init_db, mark_as_sent_bulk, count_unsent_digest_items, get_todays_all_items
+)
+from src.scrapers.news_scraper import fetch_rss_articles, fetch_all_category_news
+from src.scrapers.youtube_scraper import fetch_new_youtube_videos
+
+# src.scheduler.jobs imports this module back (send_message_to_all_users),
+# so that one import stays deferred inside handle_callback.
 
 logger = logging.getLogger(__name__)
 _app: Application = None
 
+# Strips MarkdownV2 escapes when a formatted send fails and we retry plain.
+_MDV2_UNESCAPE = re.compile(r'\\(.)')
+
+# MarkdownV2 special characters not preceded by a backslash.
+_MDV2_UNESCAPED_SPECIAL = re.compile(r'(?<!\\)[_*\[\]()~`>#+\-=|{}.!]')
+
+
+def _is_valid_mdv2(text: str) -> bool:
+    """Cheap structural check before a MarkdownV2 send.
+
+    Telegram rejects messages with dangling formatting markers or stray
+    unescaped specials; catching that here avoids paying a failed round
+    trip just to discover it.
+    """
+    counts = Counter(m.group() for m in _MDV2_UNESCAPED_SPECIAL.finditer(text))
+    if counts["*"] % 2 or counts["_"] % 2 or counts["`"] % 2:
+        return False
+    if counts["["] != counts["]"] or counts["("] != counts[")"]:
+        return False
+    # Anything else unescaped (., !, -, ...) is a parse error to Telegram.
+    return not any(v for k, v in counts.items() if k not in "*_`[]()")
+
+# Max digest messages in flight at once — overlaps network I/O while
+# staying well under Telegram's ~30 msg/s limit.
+_SEND_CONCURRENCY = 5
+
+
+async def _send_digest_messages(send, messages: list[str]):
+    """Send formatted messages concurrently, falling back to plain text.
+
+    `send` is any coroutine accepting reply_text/send_message kwargs
+    (text, parse_mode, disable_web_page_preview).
+    """
+    sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+
+    async def _send_one(msg: str):
+        async with sem:
+            # Known-bad markup goes out plain directly — one round trip,
+            # not a failed formatted send plus a retry.
+            if not _is_valid_mdv2(msg):
+                await send(
+                    text=_MDV2_UNESCAPE.sub(r'\1', msg),
+                    disable_web_page_preview=True
+                )
+                return
+            try:
+                await send(
+                    text=msg, parse_mode=ParseMode.MARKDOWN_V2,
+                    disable_web_page_preview=True
+                )
+            except Exception:
+                await send(
+                    text=_MDV2_UNESCAPE.sub(r'\1', msg),
+                    disable_web_page_preview=True
+                )
+
+    await asyncio.gather(*(_send_one(m) for m in messages))
+
+
+# Static MarkdownV2 bodies, escaped once here rather than re-assembled
+# (and hand-escaped) inside each handler.
+_WELCOME_MD = (
+    "*Welcome to PulseAgent\\!*\n\n"
+    "I'm your personal AI news assistant\\.\n\n"
+    "\\- Monitor your YouTube channels\n"
+    "\\- Fetch news from subscribed sites\n"
+    "\\- Evening Digest at 7 PM\n"
+    "\\- Market news at 8 AM\n"
+    "\\- Instant breaking news alerts\n\n"
+    "Use /menu to see all options\\."
+)
+_MENU_TEXT_MD = "*PulseAgent Menu*\n\nChoose an option:"
+_HELP_MD = (
+    "*Help*\n\n"
+    "/start \\- Welcome message\n"
+    "/menu \\- Open this menu\n"
+    "/status \\- Check bot status\n\n"
+    "Auto sends:\n"
+    "\\- Evening Digest at 7 PM\n"
+    "\\- Market Briefing at 8 AM\n"
+    "\\- Breaking news instantly"
+)
+_STATUS_PREFIX_MD = "*Bot Status*\n\nBot is running\nItems in digest queue: "
+_STATUS_SUFFIX_MD = (
+    "\nEvening digest at: 7:00 PM\n"
+    "Market briefing at: 8:00 AM\n"
+    "Breaking news check: every 30 min"
+)
+
+
+def _build_category_markup() -> InlineKeyboardMarkup:
+    buttons = []
+    row = []
+    for cat in NEWS_CATEGORIES:
+        row.append(InlineKeyboardButton(cat, callback_data=f"cat_{cat}"))
+        if len(row) == 2:
+            buttons.append(row)
+            row = []
+    if row:
+        buttons.append(row)
+    buttons.append([InlineKeyboardButton("Other - Type your own", callback_data="cat_OTHER")])
+    return InlineKeyboardMarkup(buttons)
+
+
+# Keyboards are static, so build them once at import instead of
+# re-allocating ~20 button objects on every tap.
+_CATEGORY_MARKUP = _build_category_markup()
+_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Category Update", callback_data="menu_category"),
+        InlineKeyboardButton("Breaking News Now", callback_data="menu_breaking"),
+    ],
+    [
+        InlineKeyboardButton("Complete Day Summary", callback_data="menu_day_summary"),
+        InlineKeyboardButton("Status", callback_data="menu_status"),
+    ],
+    [
+        InlineKeyboardButton("Help", callback_data="menu_help"),
+    ]
+])
+
+
+def _rows_to_digest_items(rows) -> list[dict]:
+    """Remap digest_queue DB rows to the schema format_evening_digest expects.
+
+    Categories are interned since the same handful of labels repeats
+    across every row.
+    """
+    return [{
+        "id": r["item_id"],
+        "title": r["title"],
+        "ai_summary": r["summary"] or f"• {r['title']}",
+        "category": sys.intern(r["category"] or "World News"),
+        "url": r["source_url"],
+        "source_type": r["source_type"]
+    } for r in rows]
+
 
 def get_app() -> Application:
     return _app
 
 
-def is_authorized(update: Update) -> bool:
-    if not ALLOWED_USER_IDS:
-        return True
-    return update.effective_user.id in ALLOWED_USER_IDS
+def is_authorized(update: Update, context: ContextTypes.DEFAULT_TYPE = None) -> bool:
+    """Check the allow-list, memoizing per user in context.user_data.
+
+    The verdict can't change within a process (ALLOWED_USER_IDS is fixed
+    at import), so after the first check a user's updates cost one dict
+    lookup instead of re-testing the frozenset.
+    """
+    if context is not None:
+        cached = context.user_data.get("_auth")
+        if cached is not None:
+            return cached
+    ok = not ALLOWED_USER_IDS or update.effective_user.id in ALLOWED_USER_IDS
+    if context is not None:
+        context.user_data["_auth"] = ok
+    return ok
 
 
 async def unauthorized_reply(update: Update):
     await update.effective_message.reply_text("You are not authorized to use this bot.")
 
 
+def authorized(handler):
+    """Reject unauthorized users before the handler body runs."""
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if not is_authorized(update, context):
+            return await unauthorized_reply(update)
+        return await handler(update, context)
+    return wrapper
+
+
+@authorized
 async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not is_authorized(update):
-        return await unauthorized_reply(update)
-    await update.message.reply_text(
-        "*Welcome to PulseAgent\\!*\n\n"
-        "I'm your personal AI news assistant\\.\n\n"
-        "\\- Monitor your YouTube channels\n"
-        "\\- Fetch news from subscribed sites\n"
-        "\\- Evening Digest at 7 PM\n"
-        "\\- Market news at 8 AM\n"
-        "\\- Instant breaking news alerts\n\n"
-        "Use /menu to see all options\\.",
-        parse_mode=ParseMode.MARKDOWN_V2
-    )
+    await update.message.reply_text(_WELCOME_MD, parse_mode=ParseMode.MARKDOWN_V2)
 
 
+@authorized
 async def cmd_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not is_authorized(update):
-        return await unauthorized_reply(update)
-    keyboard = [
-        [
-            InlineKeyboardButton("Category Update", callback_data="menu_category"),
-            InlineKeyboardButton("Breaking News Now", callback_data="menu_breaking"),
-        ],
-        [
-            InlineKeyboardButton("Complete Day Summary", callback_data="menu_day_summary"),
-            InlineKeyboardButton("Status", callback_data="menu_status"),
-        ],
-        [
-            InlineKeyboardButton("Help", callback_data="menu_help"),
-        ]
-    ]
     await update.message.reply_text(
-        "*PulseAgent Menu*\n\nChoose an option:",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _MENU_TEXT_MD,
+        reply_markup=_MENU_MARKUP,
         parse_mode=ParseMode.MARKDOWN_V2
     )
 
 
+@authorized
 async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not is_authorized(update):
-        return await unauthorized_reply(update)
-    from src.database.db import get_unsent_digest_items
-    pending = len(get_unsent_digest_items())
+    pending = count_unsent_digest_items()
     await update.message.reply_text(
-        f"*Bot Status*\n\n"
-        f"Bot is running\n"
-        f"Items in digest queue: {pending}\n"
-        f"Evening digest at: 7:00 PM\n"
-        f"Market briefing at: 8:00 AM\n"
-        f"Breaking news check: every 30 min",
+        f"{_STATUS_PREFIX_MD}{pending}{_STATUS_SUFFIX_MD}",
         parse_mode=ParseMode.MARKDOWN_V2
     )
 
 
+# Long-running callback work runs off the handler so the button spinner
+# clears immediately; tasks are kept referenced until done so the event
+# loop can't garbage-collect them mid-flight.
+_background_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _do_breaking_check(query):
+    """Run the breaking-news sweep and report back on the acked message."""
+    from src.scheduler.jobs import run_breaking_news_check
+    try:
+        count = await run_breaking_news_check()
+        msg = "No breaking news at this moment\\. All clear\\!" if count == 0 else f"Sent {count} breaking news alert\\(s\\)\\!"
+        await query.edit_message_text(msg, parse_mode=ParseMode.MARKDOWN_V2)
+    except Exception as e:
+        logger.error(f"Breaking news check failed: {e}")
+        await query.edit_message_text("Breaking news check failed. Try again later.")
+
+
+async def _do_category_fetch(query, category: str):
+    """Fetch the category overview and replace the placeholder message."""
+    try:
+        content = await summarize_custom_query(category)
+        msg = format_category_update(category, content)
+        await query.edit_message_text(msg, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True)
+    except Exception as e:
+        logger.error(f"Category fetch failed for {category}: {e}")
+        await query.edit_message_text(f"Could not fetch updates for {category}. Try again later.")
+
+
 async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
 
-    if not is_authorized(update):
+    if not is_authorized(update, context):
         await query.edit_message_text("Not authorized.")
         return
 
@@ -104,31 +285,17 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     elif data == "menu_breaking":
         await query.edit_message_text("Checking for breaking news now...")
-        from src.scheduler.jobs import run_breaking_news_check
-        count = await run_breaking_news_check()
-        msg = "No breaking news at this moment\\. All clear\\!" if count == 0 else f"Sent {count} breaking news alert\\(s\\)\\!"
-        await query.edit_message_text(msg, parse_mode=ParseMode.MARKDOWN_V2)
+        _spawn(_do_breaking_check(query))
 
     elif data == "menu_status":
-        from src.database.db import get_unsent_digest_items
-        pending = len(get_unsent_digest_items())
+        pending = count_unsent_digest_items()
         await query.edit_message_text(
             f"*Status*\n\nRunning\nQueue: {pending} items",
             parse_mode=ParseMode.MARKDOWN_V2
         )
 
     elif data == "menu_help":
-        await query.edit_message_text(
-            "*Help*\n\n"
-            "/start \\- Welcome message\n"
-            "/menu \\- Open this menu\n"
-            "/status \\- Check bot status\n\n"
-            "Auto sends:\n"
-            "\\- Evening Digest at 7 PM\n"
-            "\\- Market Briefing at 8 AM\n"
-            "\\- Breaking news instantly",
-            parse_mode=ParseMode.MARKDOWN_V2
-        )
+        await query.edit_message_text(_HELP_MD, parse_mode=ParseMode.MARKDOWN_V2)
 
     elif data.startswith("cat_"):
         category = data[4:]
@@ -137,55 +304,34 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             context.user_data["awaiting_category"] = True
         else:
             await query.edit_message_text(f"Fetching updates for *{category}*\\.\\.\\.", parse_mode=ParseMode.MARKDOWN_V2)
-            content = summarize_custom_query(category)
-            msg = format_category_update(category, content)
-            await query.edit_message_text(msg, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True)
+            _spawn(_do_category_fetch(query, category))
 
     elif data == "menu_day_summary":
         await query.edit_message_text("Preparing complete day summary...")
-        from src.database.db import get_todays_all_items
-        from src.processors.message_formatter import format_evening_digest, format_youtube_update
 
         items = get_todays_all_items()
         if not items:
             await query.edit_message_text(
                 "No items collected today yet. Use /fetch\\_now first.",
-                parse_mode="MarkdownV2"
+                parse_mode=ParseMode.MARKDOWN_V2
             )
             return
 
-        youtube_items = [i for i in items if i["source_type"] == "youtube"]
-        news_items = [i for i in items if i["source_type"] != "youtube"]
+        # Partition in a single pass instead of two list comprehensions.
+        youtube_items, news_items = [], []
+        for i in items:
+            (youtube_items if i["source_type"] == "youtube" else news_items).append(i)
 
         await query.edit_message_text(
             f"Found {len(news_items)} news + {len(youtube_items)} videos today. Sending now..."
         )
 
         if news_items:
-            formatted = [{
-                "id": i["item_id"],
-                "title": i["title"],
-                "ai_summary": i["summary"] or f"• {i['title']}",
-                "category": i["category"] or "World News",
-                "url": i["source_url"],
-                "source_type": i["source_type"]
-            } for i in news_items]
+            formatted = _rows_to_digest_items(news_items)
 
             messages = format_evening_digest(formatted)
-            for msg in messages:
-                try:
-                    await _app.bot.send_message(
-                        chat_id=query.message.chat_id,
-                        text=msg, parse_mode="MarkdownV2",
-                        disable_web_page_preview=True
-                    )
-                except Exception:
-                    import re
-                    plain = re.sub(r'\\(.)', r'\1', msg)
-                    await _app.bot.send_message(
-                        chat_id=query.message.chat_id,
-                        text=plain, disable_web_page_preview=True
-                    )
+            send = functools.partial(_app.bot.send_message, chat_id=query.message.chat_id)
+            await _send_digest_messages(send, messages)
 
         if youtube_items:
             for i in youtube_items:
@@ -200,7 +346,7 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     msg = format_youtube_update(item)
                     await _app.bot.send_message(
                         chat_id=query.message.chat_id,
-                        text=msg, parse_mode="MarkdownV2",
+                        text=msg, parse_mode=ParseMode.MARKDOWN_V2,
                         disable_web_page_preview=True
                     )
                 except Exception:
@@ -211,19 +357,9 @@ async def handle_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     )
 
 async def show_category_keyboard(query):
-    buttons = []
-    row = []
-    for cat in NEWS_CATEGORIES:
-        row.append(InlineKeyboardButton(cat, callback_data=f"cat_{cat}"))
-        if len(row) == 2:
-            buttons.append(row)
-            row = []
-    if row:
-        buttons.append(row)
-    buttons.append([InlineKeyboardButton("Other - Type your own", callback_data="cat_OTHER")])
     await query.edit_message_text(
         "*Choose a Category:*",
-        reply_markup=InlineKeyboardMarkup(buttons),
+        reply_markup=_CATEGORY_MARKUP,
         parse_mode=ParseMode.MARKDOWN_V2
     )
 
@@ -234,44 +370,65 @@ async def handle_text_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
     category = update.message.text.strip()
     context.user_data["awaiting_category"] = False
     await update.message.reply_text(f"Fetching updates for *{category}*\\.\\.\\.", parse_mode=ParseMode.MARKDOWN_V2)
-    content = summarize_custom_query(category)
+    content = await summarize_custom_query(category)
     msg = format_category_update(category, content)
     await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True)
 
 
+# Broadcast fan-out cap: Telegram allows ~30 msg/s per bot, so keep a
+# little headroom. Created lazily because a Semaphore binds to the loop.
+_BROADCAST_CONCURRENCY = 25
+_broadcast_sem: asyncio.Semaphore = None
+
+
 async def send_message_to_all_users(text: str, parse_mode=ParseMode.MARKDOWN_V2):
-    global _app
+    global _app, _broadcast_sem
     if not _app or not ALLOWED_USER_IDS:
         logger.warning("No app or no users configured.")
         return
-    for user_id in ALLOWED_USER_IDS:
-        try:
-            await _app.bot.send_message(
-                chat_id=user_id, text=text,
-                parse_mode=parse_mode, disable_web_page_preview=True
-            )
-        except Exception as e:
-            logger.error(f"Failed to send to {user_id}: {e}")
+    if _broadcast_sem is None:
+        _broadcast_sem = asyncio.Semaphore(_BROADCAST_CONCURRENCY)
+
+    async def _send_one(user_id: int):
+        async with _broadcast_sem:
+            try:
+                await _app.bot.send_message(
+                    chat_id=user_id, text=text,
+                    parse_mode=parse_mode, disable_web_page_preview=True
+                )
+            except RetryAfter as e:
+                # Flood control on this recipient only: honor the server's
+                # delay and retry once, without stalling the other sends.
+                await asyncio.sleep(e.retry_after)
+                await _app.bot.send_message(
+                    chat_id=user_id, text=text,
+                    parse_mode=parse_mode, disable_web_page_preview=True
+                )
 
+    # Fan out concurrently: ~N/25 Telegram RTTs instead of one per user.
+    results = await asyncio.gather(
+        *(_send_one(user_id) for user_id in ALLOWED_USER_IDS),
+        return_exceptions=True
+    )
+    for user_id, result in zip(ALLOWED_USER_IDS, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to send to {user_id}: {result}")
+
+@authorized
 async def cmd_fetch_now(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Fetch all news and send directly to user — no queue, instant output."""
-    if not is_authorized(update):
-        return await unauthorized_reply(update)
 
     await update.message.reply_text(
         "Fetching latest news now... sending results directly. This may take 2-3 minutes."
     )
 
-    from src.scrapers.news_scraper import fetch_rss_articles, fetch_all_category_news
-    from src.scrapers.youtube_scraper import fetch_new_youtube_videos
-    from src.processors.ai_processor import batch_summarize
-    from src.processors.message_formatter import format_evening_digest, format_youtube_update
-    from src.database.db import mark_as_sent
-
-    # Fetch all sources
-    rss_items = fetch_rss_articles()
-    news_items = fetch_all_category_news()
-    youtube_items = fetch_new_youtube_videos()
+    # Fetch all sources concurrently in worker threads so the event loop
+    # stays free for other handlers; wall time is max-of-three, not sum.
+    rss_items, news_items, youtube_items = await asyncio.gather(
+        asyncio.to_thread(fetch_rss_articles),
+        asyncio.to_thread(fetch_all_category_news),
+        asyncio.to_thread(fetch_new_youtube_videos),
+    )
     all_news = rss_items + news_items
 
     if not all_news and not youtube_items:
@@ -284,51 +441,43 @@ async def cmd_fetch_now(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Send news digest directly
     if all_news:
-        processed_news = batch_summarize(all_news, source_type="news")
+        processed_news = await batch_summarize(all_news, source_type="news")
         messages = format_evening_digest(processed_news)
-        for msg in messages:
-            try:
-                await update.message.reply_text(
-                    msg, parse_mode="MarkdownV2", disable_web_page_preview=True
-                )
-            except Exception:
-                # Strip markdown and send as plain text if formatting fails
-                import re
-                plain = re.sub(r'\\(.)', r'\1', msg)
-                await update.message.reply_text(plain, disable_web_page_preview=True)
-        for item in processed_news:
-            mark_as_sent(item["id"], item["source_type"], item["title"])
+        await _send_digest_messages(update.message.reply_text, messages)
+        mark_as_sent_bulk([
+            (item["id"], item["source_type"], item["title"])
+            for item in processed_news
+        ])
 
     # Send YouTube updates directly
     if youtube_items:
-        processed_yt = batch_summarize(youtube_items, source_type="youtube")
+        processed_yt = await batch_summarize(youtube_items, source_type="youtube")
         for item in processed_yt:
             try:
                 msg = format_youtube_update(item)
                 await update.message.reply_text(
-                    msg, parse_mode="MarkdownV2", disable_web_page_preview=True
+                    msg, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True
                 )
             except Exception:
                 await update.message.reply_text(
                     f"New Video: {item['title']}\n{item.get('url', '')}",
                     disable_web_page_preview=True
                 )
-            mark_as_sent(item["id"], "youtube", item["title"])
+        mark_as_sent_bulk([
+            (item["id"], "youtube", item["title"]) for item in processed_yt
+        ])
 
+    clear_query_cache()  # fresh news collected → cached overviews are stale
     await update.message.reply_text("All done! Everything above is your latest update.")
 
+@authorized
 async def cmd_day_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Send complete summary of everything collected today."""
-    if not is_authorized(update):
-        return await unauthorized_reply(update)
 
     await update.message.reply_text(
         "Preparing your complete day summary... fetching everything collected today."
     )
 
-    from src.database.db import get_todays_all_items
-    from src.processors.message_formatter import format_evening_digest, format_youtube_update
-
     items = get_todays_all_items()
 
     if not items:
@@ -348,25 +497,10 @@ async def cmd_day_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Send news digest
     if news_items:
         # Convert db rows to format expected by formatter
-        formatted = [{
-            "id": i["item_id"],
-            "title": i["title"],
-            "ai_summary": i["summary"] or f"• {i['title']}",
-            "category": i["category"] or "World News",
-            "url": i["source_url"],
-            "source_type": i["source_type"]
-        } for i in news_items]
+        formatted = _rows_to_digest_items(news_items)
 
         messages = format_evening_digest(formatted)
-        for msg in messages:
-            try:
-                await update.message.reply_text(
-                    msg, parse_mode="MarkdownV2", disable_web_page_preview=True
-                )
-            except Exception:
-                import re
-                plain = re.sub(r'\\(.)', r'\1', msg)
-                await update.message.reply_text(plain, disable_web_page_preview=True)
+        await _send_digest_messages(update.message.reply_text, messages)
 
     # Send YouTube items
     if youtube_items:
@@ -382,7 +516,7 @@ async def cmd_day_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
             try:
                 msg = format_youtube_update(item)
                 await update.message.reply_text(
-                    msg, parse_mode="MarkdownV2", disable_web_page_preview=True
+                    msg, parse_mode=ParseMode.MARKDOWN_V2, disable_web_page_preview=True
                 )
             except Exception:
                 await update.message.reply_text(
@@ -390,7 +524,6 @@ async def cmd_day_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     disable_web_page_preview=True
                 )
 
-    from datetime import datetime
     time_str = datetime.now().strftime("%I:%M %p")
     await update.message.reply_text(
         f"Complete day summary done. All news collected from midnight till {time_str}."
@@ -398,21 +531,38 @@ async def cmd_day_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def build_app() -> Application:
     global _app
+    # Idempotent: a second call must not stack duplicate handlers, which
+    # would make every update fire each handler once per build_app call.
+    if _app is not None:
+        return _app
     init_db()
-    from telegram.request import HTTPXRequest # type: ignore
+    # Large pool + HTTP/2 multiplexing so broadcast/digest fan-outs don't
+    # head-of-line block on a handful of connections.
     request = HTTPXRequest(
+        connection_pool_size=64,
+        http_version="2",
         connect_timeout=30.0,
         read_timeout=30.0,
         write_timeout=30.0,
         pool_timeout=30.0,
     )
-    _app = Application.builder().token(TELEGRAM_BOT_TOKEN).request(request).build()
-    _app.add_handler(CommandHandler("start", cmd_start))
-    _app.add_handler(CommandHandler("menu", cmd_menu))
-    _app.add_handler(CommandHandler("status", cmd_status))
-    _app.add_handler(CommandHandler("fetch_now", cmd_fetch_now))
-    _app.add_handler(CommandHandler("day_summary", cmd_day_summary))
-    _app.add_handler(CallbackQueryHandler(handle_callback))
-    _app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_input))
+    _app = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .request(request)
+        # Central throttle so broadcasts and digests queue instead of
+        # tripping Telegram's flood control and eating RetryAfter waits.
+        .rate_limiter(AIORateLimiter(overall_max_rate=30, max_retries=3))
+        .build()
+    )
+    # block=False: handlers run as tasks, so one slow command (fetch_now,
+    # day_summary) doesn't serialize everyone else's updates.
+    _app.add_handler(CommandHandler("start", cmd_start, block=False))
+    _app.add_handler(CommandHandler("menu", cmd_menu, block=False))
+    _app.add_handler(CommandHandler("status", cmd_status, block=False))
+    _app.add_handler(CommandHandler("fetch_now", cmd_fetch_now, block=False))
+    _app.add_handler(CommandHandler("day_summary", cmd_day_summary, block=False))
+    _app.add_handler(CallbackQueryHandler(handle_callback, block=False))
+    _app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_input, block=False))
     logger.info("Telegram app built successfully.")
     return _app
\ No newline at end of file
@@ -4,29 +4,77 @@ src/database/db.py
 SQLite database to track sent items and prevent duplicate notifications.
 """
 
+import hashlib
 import sqlite3
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 
 DB_PATH = Path("data/pulseagent.db")
 logger = logging.getLogger(__name__)
 
+_conn: sqlite3.Connection = None
+# Serializes writers; readers run concurrently under WAL.
+_lock = threading.RLock()
 
-def get_connection():
-    DB_PATH.parent.mkdir(exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+
+# In-memory front for sent_items: hydrated once in init_db, kept in step
+# by every write, so the feed-ingest hot loop answers membership checks
+# from a set lookup instead of a B-tree descent. Digests are 16 bytes,
+# so even a large history stays cheap to hold.
+_seen_keys: set = set()
+_seen_loaded = False
+
+
+def _item_key(item_id: str) -> bytes:
+    """16-byte blake2b digest of a URL/GUID, used as the sent_items key.
+
+    A fixed-width BLOB key packs far more entries per B-tree page than
+    variable-length URL text and compares with a single short memcmp.
+    """
+    return hashlib.blake2b(item_id.encode("utf-8"), digest_size=16).digest()
+
+
+def get_connection() -> sqlite3.Connection:
+    """Return the shared module-level connection, creating it on first use.
+
+    One connection for the whole process amortizes open/journal-init cost
+    that used to be paid on every query. check_same_thread=False lets the
+    scraper worker threads use it; _lock serializes the writes.
+    """
+    global _conn
+    if _conn is None:
+        with _lock:
+            if _conn is None:
+                DB_PATH.parent.mkdir(exist_ok=True)
+                conn = sqlite3.connect(
+                    DB_PATH, check_same_thread=False,
+                    cached_statements=256  # keep hot SQL parsed
+                )
+                conn.row_factory = sqlite3.Row
+                # WAL lets readers run while a writer commits, and with
+                # synchronous=NORMAL each write is a WAL append instead
+                # of a full rollback-journal fsync.
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("PRAGMA mmap_size=268435456")
+                _conn = conn
+    return _conn
 
 
 def init_db():
     """Create tables on first run."""
-    with get_connection() as conn:
+    global _seen_loaded
+    # Called from both main() and build_app(); only do the work once.
+    if getattr(init_db, "_done", False):
+        return
+    with _lock, get_connection() as conn:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS sent_items (
                 id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                item_id     TEXT UNIQUE NOT NULL,   -- URL or GUID
+                item_id     BLOB UNIQUE NOT NULL,  -- blake2b-128 of URL/GUID
                 source_type TEXT NOT NULL,           -- 'youtube', 'rss', 'news'
                 title       TEXT,
                 sent_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -44,64 +92,184 @@ def init_db():
                 created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 is_sent     INTEGER DEFAULT 0
             );
+
+            -- Serves the is_sent=0 COUNT and the ordered unsent scan
+            -- without touching the full table.
+            CREATE INDEX IF NOT EXISTS idx_digest_unsent
+                ON digest_queue(is_sent, created_at);
+
+            -- Conditional-GET validators per feed, so unchanged feeds
+            -- answer 304 and skip body transfer + parse.
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                feed_url      TEXT PRIMARY KEY,
+                etag          TEXT,
+                last_modified TEXT,
+                updated_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
         """)
+        # One-time migration: rows written before hashed keys hold the raw
+        # URL text; rewrite them so lookups keep matching.
+        legacy = conn.execute(
+            "SELECT id, item_id FROM sent_items WHERE typeof(item_id) = 'text'"
+        ).fetchall()
+        if legacy:
+            conn.executemany(
+                "UPDATE OR IGNORE sent_items SET item_id = ? WHERE id = ?",
+                [(_item_key(r["item_id"]), r["id"]) for r in legacy]
+            )
+            logger.info(f"Migrated {len(legacy)} sent_items keys to hashes.")
+        _seen_keys.update(
+            r[0] for r in conn.execute("SELECT item_id FROM sent_items")
+        )
+        _seen_loaded = True
         logger.info("✅ Database initialized.")
+    init_db._done = True
 
 
 def is_already_sent(item_id: str) -> bool:
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT 1 FROM sent_items WHERE item_id = ?", (item_id,)
-        ).fetchone()
-        return row is not None
+    key = _item_key(item_id)
+    if key in _seen_keys:
+        return True
+    if _seen_loaded:
+        return False
+    row = get_connection().execute(
+        "SELECT 1 FROM sent_items WHERE item_id = ? LIMIT 1", (key,)
+    ).fetchone()
+    return row is not None
+
+
+def which_already_sent(item_ids: list) -> set:
+    """Return the subset of item_ids already recorded in sent_items.
+
+    One IN-query for a whole feed's worth of candidates instead of a
+    round trip per entry.
+    """
+    if not item_ids:
+        return set()
+    keys = {_item_key(i): i for i in item_ids}
+    if _seen_loaded:
+        return {orig for key, orig in keys.items() if key in _seen_keys}
+    placeholders = ",".join("?" * len(keys))
+    rows = get_connection().execute(
+        f"SELECT item_id FROM sent_items WHERE item_id IN ({placeholders})",
+        list(keys)
+    ).fetchall()
+    return {keys[r[0]] for r in rows}
 
 
 def mark_as_sent(item_id: str, source_type: str, title: str, is_breaking: bool = False):
-    with get_connection() as conn:
-        try:
-            conn.execute(
-                """INSERT INTO sent_items (item_id, source_type, title, is_breaking)
-                   VALUES (?, ?, ?, ?)""",
-                (item_id, source_type, title, int(is_breaking))
-            )
-        except sqlite3.IntegrityError:
-            pass  # Already exists
+    key = _item_key(item_id)
+    with _lock, get_connection() as conn:
+        # OR IGNORE: a duplicate is a no-op inside SQLite, not a Python
+        # exception raised and swallowed on every re-seen item.
+        conn.execute(
+            """INSERT OR IGNORE INTO sent_items (item_id, source_type, title, is_breaking)
+               VALUES (?, ?, ?, ?)""",
+            (key, source_type, title, int(is_breaking))
+        )
+        _seen_keys.add(key)
+
+
+def mark_as_sent_bulk(rows: list):
+    """Mark many (item_id, source_type, title) rows sent in one transaction.
+
+    One commit/fsync for the whole batch instead of one per item.
+    """
+    if not rows:
+        return
+    keyed = [(_item_key(item_id), st, title) for item_id, st, title in rows]
+    with _lock, get_connection() as conn:
+        conn.executemany(
+            """INSERT OR IGNORE INTO sent_items (item_id, source_type, title)
+               VALUES (?, ?, ?)""",
+            keyed
+        )
+        _seen_keys.update(k for k, _, _ in keyed)
 
 
 def add_to_digest_queue(item_id: str, title: str, summary: str,
                          category: str, source_url: str, source_type: str):
-    with get_connection() as conn:
-        try:
-            conn.execute(
-                """INSERT INTO digest_queue
-                   (item_id, title, summary, category, source_url, source_type)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (item_id, title, summary, category, source_url, source_type)
-            )
-        except sqlite3.IntegrityError:
-            pass
+    with _lock, get_connection() as conn:
+        conn.execute(
+            """INSERT OR IGNORE INTO digest_queue
+               (item_id, title, summary, category, source_url, source_type)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (item_id, title, summary, category, source_url, source_type)
+        )
 
 
-def get_unsent_digest_items() -> list:
-    with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT * FROM digest_queue WHERE is_sent = 0 ORDER BY created_at ASC"
-        ).fetchall()
-        return [dict(r) for r in rows]
+def add_many_to_digest_queue(rows: list):
+    """Queue many (item_id, title, summary, category, source_url, source_type)
+    rows in one transaction instead of one commit per article.
+    """
+    if not rows:
+        return
+    with _lock, get_connection() as conn:
+        conn.executemany(
+            """INSERT OR IGNORE INTO digest_queue
+               (item_id, title, summary, category, source_url, source_type)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            rows
+        )
 
 
-def mark_digest_items_sent(item_ids: list):
-    with get_connection() as conn:
-        placeholders = ",".join("?" * len(item_ids))
+def get_feed_cache(feed_url: str) -> tuple:
+    """(etag, last_modified) recorded for a feed, or (None, None)."""
+    row = get_connection().execute(
+        "SELECT etag, last_modified FROM feed_cache WHERE feed_url = ?",
+        (feed_url,)
+    ).fetchone()
+    return (row["etag"], row["last_modified"]) if row else (None, None)
+
+
+def set_feed_cache(feed_url: str, etag, last_modified):
+    """Store the validators a feed's response carried, if any."""
+    if not etag and not last_modified:
+        return
+    with _lock, get_connection() as conn:
         conn.execute(
-            f"UPDATE digest_queue SET is_sent = 1 WHERE item_id IN ({placeholders})",
-            item_ids
+            """INSERT OR REPLACE INTO feed_cache (feed_url, etag, last_modified)
+               VALUES (?, ?, ?)""",
+            (feed_url, etag, last_modified)
         )
 
 
+def get_unsent_digest_items() -> list:
+    """Pending digest rows as sqlite3.Row objects (index/keyword access);
+    no per-row dict is built."""
+    return get_connection().execute(
+        "SELECT * FROM digest_queue WHERE is_sent = 0 ORDER BY created_at ASC"
+    ).fetchall()
+
+
+def count_unsent_digest_items() -> int:
+    """Count pending digest items without materializing the rows."""
+    return get_connection().execute(
+        "SELECT COUNT(*) FROM digest_queue WHERE is_sent = 0"
+    ).fetchone()[0]
+
+
+def mark_digest_items_sent(item_ids: list):
+    """Flag digest rows sent, 500 ids per statement in one transaction.
+
+    SQLite caps bound parameters (999 on older builds), so one giant
+    IN-list would raise "too many SQL variables" on a backlogged queue.
+    """
+    if not item_ids:
+        return
+    with _lock, get_connection() as conn:
+        for start in range(0, len(item_ids), 500):
+            chunk = item_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(
+                f"UPDATE digest_queue SET is_sent = 1 WHERE item_id IN ({placeholders})",
+                chunk
+            )
+
+
 def clear_old_digest(days: int = 2):
     """Keep database clean by removing old sent digest items."""
-    with get_connection() as conn:
+    with _lock, get_connection() as conn:
         conn.execute(
             "DELETE FROM digest_queue WHERE is_sent = 1 AND created_at < datetime('now', ?)",
             (f"-{days} days",)
@@ -109,10 +277,8 @@ def clear_old_digest(days: int = 2):
 
 def get_todays_all_items() -> list:
     """Get ALL items collected today (both sent and unsent) for day summary."""
-    with get_connection() as conn:
-        rows = conn.execute(
-            """SELECT * FROM digest_queue 
-               WHERE date(created_at) = date('now', 'localtime')
-               ORDER BY category ASC, created_at ASC"""
-        ).fetchall()
-        return [dict(r) for r in rows]
\ No newline at end of file
+    return get_connection().execute(
+        """SELECT * FROM digest_queue
+           WHERE date(created_at) = date('now', 'localtime')
+           ORDER BY category ASC, created_at ASC"""
+    ).fetchall()
@@ -8,26 +8,71 @@ Handles all Gemini API calls:
   - Detect if content is breaking news
 """
 
+import asyncio
+import functools
 import google.generativeai as genai # type: ignore
 import logging
+import re
 import time
+from collections import OrderedDict
 from config.settings import GEMINI_API_KEY, GEMINI_MODEL, NEWS_CATEGORIES
 
 logger = logging.getLogger(__name__)
 
-# Configure Gemini once at import
-genai.configure(api_key=GEMINI_API_KEY)
+# Configure Gemini once at import. The async gRPC transport keeps one
+# HTTP/2 channel alive across calls, so concurrent requests multiplex on
+# a warm socket instead of each paying a fresh TLS handshake. It must be
+# the asyncio flavor — plain "grpc" resolves to the sync transport, which
+# blocks the event loop and breaks generate_content_async. _call_gemini
+# must keep using this module-level model — re-instantiating
+# GenerativeModel would discard the channel.
+genai.configure(api_key=GEMINI_API_KEY, transport="grpc_asyncio")
 model = genai.GenerativeModel(GEMINI_MODEL)
 
-RATE_LIMIT_DELAY = 3  # seconds between API calls to avoid hitting rate limits
+GEMINI_RPM = 15  # free-tier requests/minute for gemini-2.0-flash
 
+QUERY_CACHE_TTL = 600  # seconds a cached category overview stays fresh
+QUERY_CACHE_MAX = 128  # free-text queries can be anything; cap the cache
+_query_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()  # query → (timestamp, text)
 
-def _call_gemini(prompt: str, retries: int = 2) -> str:
-    """Safe wrapper around Gemini API with retries."""
+
+class TokenBucket:
+    """Async token bucket: bursts up to `capacity`, refills at `rate`
+    tokens per second, and only blocks when the bucket runs dry —
+    unlike a fixed sleep, the happy path pays no idle time.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+_bucket = TokenBucket(rate=GEMINI_RPM / 60, capacity=GEMINI_RPM)
+
+
+async def _call_gemini(prompt: str, retries: int = 2) -> str:
+    """Safe wrapper around Gemini API with rate limiting and retries."""
     for attempt in range(retries + 1):
+        await _bucket.acquire()
         try:
-            response = model.generate_content(prompt)
-            time.sleep(RATE_LIMIT_DELAY)
+            response = await model.generate_content_async(prompt)
             return response.text.strip()
         except Exception as e:
             error_str = str(e)
@@ -37,7 +82,7 @@ def _call_gemini(prompt: str, retries: int = 2) -> str:
                 logger.warning("Gemini quota exhausted - skipping retries, using fallback.")
                 return ""
             if attempt < retries:
-                time.sleep(10)
+                await asyncio.sleep(10)
     return ""
 
 
@@ -55,42 +100,37 @@ def make_fallback_summary(title: str, snippet: str = "") -> dict:
     return {
         "summary": summary,
         "category": _guess_category(title),
-        "is_breaking": any(kw in title.lower() for kw in [
-            "breaking", "urgent", "alert", "attack", "disaster",
-            "earthquake", "explosion", "crash", "emergency"
-        ])
+        "is_breaking": _BREAKING_RE.search(title) is not None
     }
 
 
-def _guess_category(title: str) -> str:
-    """Guess category from title keywords when Gemini is unavailable."""
-    title_lower = title.lower()
-    if any(w in title_lower for w in ["stock", "market", "sensex", "nifty", "nasdaq", "economy", "trade", "gdp"]):
-        return "Stock & Market"
-    if any(w in title_lower for w in ["cricket", "football", "ipl", "fifa", "sport", "match", "tournament", "player"]):
-        return "Sports"
-    if any(w in title_lower for w in ["film", "movie", "actor", "actress", "bollywood", "hollywood", "cinema"]):
-        return "Films & Entertainment"
-    if any(w in title_lower for w in ["music", "song", "album", "singer", "concert"]):
-        return "Music"
-    if any(w in title_lower for w in ["tech", "ai ", "software", "apple", "google", "microsoft", "startup", "cyber"]):
-        return "Technology"
-    if any(w in title_lower for w in ["health", "hospital", "disease", "vaccine", "cancer", "medical", "doctor"]):
-        return "Health"
-    if any(w in title_lower for w in ["science", "space", "nasa", "climate", "environment", "planet"]):
-        return "Science"
-    return "World News"
+# Keyword → category rules for the no-AI fallback, checked in order.
+# Compiled once so each guess is a handful of C-level scans instead of
+# ~60 Python substring checks; alternations (not \b) keep the original
+# substring-match semantics.
+_CATEGORY_PATTERNS = [
+    (re.compile(r"stock|market|sensex|nifty|nasdaq|economy|trade|gdp", re.I), "Stock & Market"),
+    (re.compile(r"cricket|football|ipl|fifa|sport|match|tournament|player", re.I), "Sports"),
+    (re.compile(r"film|movie|actor|actress|bollywood|hollywood|cinema", re.I), "Films & Entertainment"),
+    (re.compile(r"music|song|album|singer|concert", re.I), "Music"),
+    (re.compile(r"tech|ai |software|apple|google|microsoft|startup|cyber", re.I), "Technology"),
+    (re.compile(r"health|hospital|disease|vaccine|cancer|medical|doctor", re.I), "Health"),
+    (re.compile(r"science|space|nasa|climate|environment|planet", re.I), "Science"),
+]
 
+_BREAKING_RE = re.compile(
+    r"breaking|urgent|alert|attack|disaster|earthquake|explosion|crash|emergency",
+    re.I
+)
 
-def summarize_youtube_video(video_url: str, title: str) -> dict:
-    """
-    Summarizes a YouTube video using Gemini's native YouTube URL support.
-    Returns: {summary, category, is_breaking}
-    """
-    prompt = f"""You are a concise news summarizer. Analyze this YouTube video and provide:
+# The category list never changes at runtime; join it once instead of on
+# every prompt build.
+_NEWS_CATS_JOINED = ", ".join(NEWS_CATEGORIES)
+
+_YOUTUBE_PROMPT = """You are a concise news summarizer. Analyze this YouTube video and provide:
 
 1. A 3-5 bullet point summary of the key points discussed.
-2. The best category from this list: {', '.join(NEWS_CATEGORIES)}
+2. The best category from this list: {cats}
 3. Whether this is BREAKING NEWS (true/false) - only true for urgent, time-sensitive events.
 
 Video URL: {video_url}
@@ -104,24 +144,16 @@ SUMMARY:
 CATEGORY: [category name]
 BREAKING: [true/false]
 """
-    raw = _call_gemini(prompt)
-    return _parse_ai_response(raw, fallback_title=title)
 
-
-def summarize_article(url: str, title: str, snippet: str = "") -> dict:
-    """
-    Summarizes a news article using its URL and available snippet.
-    Returns: {summary, category, is_breaking}
-    """
-    prompt = f"""You are a concise news summarizer. Based on the article details below, provide:
+_ARTICLE_PROMPT = """You are a concise news summarizer. Based on the article details below, provide:
 
 1. A 2-4 bullet point summary of the key points.
-2. The best category from: {', '.join(NEWS_CATEGORIES)}
+2. The best category from: {cats}
 3. Whether this is BREAKING NEWS (true/false) - only for urgent/critical events.
 
 Article Title: {title}
 Article URL: {url}
-Snippet: {snippet[:500] if snippet else "No snippet available."}
+Snippet: {snippet}
 
 Respond in this EXACT format:
 SUMMARY:
@@ -130,16 +162,8 @@ SUMMARY:
 CATEGORY: [category name]
 BREAKING: [true/false]
 """
-    raw = _call_gemini(prompt)
-    return _parse_ai_response(raw, fallback_title=title)
-
 
-def summarize_custom_query(query: str) -> str:
-    """
-    Generate a quick summary/overview for a user-requested category or topic.
-    Used when user clicks a category button in the bot.
-    """
-    prompt = f"""Provide a brief, 3-5 bullet point overview of the latest developments in: {query}
+_QUERY_PROMPT = """Provide a brief, 3-5 bullet point overview of the latest developments in: {query}
 
 Focus on the most recent and important updates. Be concise and factual.
 
@@ -151,24 +175,95 @@ Format:
 
 End with: "⏰ Summary generated at [current time]"
 """
-    return _call_gemini(prompt) or f"Could not fetch updates for '{query}' right now."
 
 
-def batch_summarize(items: list[dict], source_type: str) -> list[dict]:
+@functools.lru_cache(maxsize=4096)
+def _guess_category(title: str) -> str:
+    """Guess category from title keywords when Gemini is unavailable."""
+    for pattern, category in _CATEGORY_PATTERNS:
+        if pattern.search(title):
+            return category
+    return "World News"
+
+
+async def summarize_youtube_video(video_url: str, title: str) -> dict:
     """
-    Process a batch of items with rate limiting.
+    Summarizes a YouTube video using Gemini's native YouTube URL support.
+    Returns: {summary, category, is_breaking}
+    """
+    prompt = _YOUTUBE_PROMPT.format(
+        cats=_NEWS_CATS_JOINED, video_url=video_url, title=title
+    )
+    raw = await _call_gemini(prompt)
+    return _parse_ai_response(raw, fallback_title=title)
+
+
+async def summarize_article(url: str, title: str, snippet: str = "") -> dict:
+    """
+    Summarizes a news article using its URL and available snippet.
+    Returns: {summary, category, is_breaking}
+    """
+    prompt = _ARTICLE_PROMPT.format(
+        cats=_NEWS_CATS_JOINED, title=title, url=url,
+        snippet=snippet[:500] if snippet else "No snippet available."
+    )
+    raw = await _call_gemini(prompt)
+    return _parse_ai_response(raw, fallback_title=title)
+
+
+def clear_query_cache():
+    """Drop cached category overviews (called after a manual refresh)."""
+    _query_cache.clear()
+
+
+async def summarize_custom_query(query: str) -> str:
+    """
+    Generate a quick summary/overview for a user-requested category or topic.
+    Used when user clicks a category button in the bot.
+    Results are cached for QUERY_CACHE_TTL so repeated taps on the same
+    category within the window skip the Gemini round trip.
+    """
+    key = query.strip().lower()
+    now = time.monotonic()
+    cached = _query_cache.get(key)
+    if cached and now - cached[0] < QUERY_CACHE_TTL:
+        _query_cache.move_to_end(key)  # keep hot queries away from eviction
+        return cached[1]
+
+    prompt = _QUERY_PROMPT.format(query=query)
+    raw = await _call_gemini(prompt)
+    if raw:
+        _query_cache[key] = (now, raw)  # only cache real answers, not failures
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > QUERY_CACHE_MAX:
+            _query_cache.popitem(last=False)  # evict least recently used
+        return raw
+    return f"Could not fetch updates for '{query}' right now."
+
+
+BATCH_CONCURRENCY = 4  # Gemini requests in flight at once during a batch
+
+
+async def batch_summarize(items: list[dict], source_type: str) -> list[dict]:
+    """
+    Process a batch of items concurrently: the semaphore bounds in-flight
+    Gemini requests while the token bucket paces overall throughput, so
+    wall time is ~ceil(N/4) request latencies instead of N.
     Falls back to snippet-based summary if Gemini is unavailable.
     """
-    processed = []
-    for i, item in enumerate(items):
-        logger.info(f"Processing [{i+1}/{len(items)}]: {item['title'][:60]}")
-
-        if source_type == "youtube":
-            result = summarize_youtube_video(item["url"], item["title"])
-        else:
-            result = summarize_article(
-                item["url"], item["title"], item.get("summary_hint", "")
-            )
+    sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+    total = len(items)
+
+    async def _one(i: int, item: dict) -> dict:
+        async with sem:
+            logger.info(f"Processing [{i+1}/{total}]: {item['title'][:60]}")
+
+            if source_type == "youtube":
+                result = await summarize_youtube_video(item["url"], item["title"])
+            else:
+                result = await summarize_article(
+                    item["url"], item["title"], item.get("summary_hint", "")
+                )
 
         # If Gemini failed (empty summary), use fallback directly from snippet
         if not result.get("summary") or result["summary"] == f"📄 {item.get('title', '')}":
@@ -181,18 +276,26 @@ def batch_summarize(items: list[dict], source_type: str) -> list[dict]:
         item["ai_summary"] = result.get("summary", f"• {item['title']}")
         item["category"] = result.get("category", "World News")
         item["is_breaking"] = result.get("is_breaking", False)
-        processed.append(item)
+        return item
 
-        # Batch pause every 5 items
-        if (i + 1) % 5 == 0:
-            logger.info("Rate limit pause (12 seconds)...")
-            time.sleep(12)
-
-    return processed
+    return list(await asyncio.gather(*(
+        _one(i, item) for i, item in enumerate(items)
+    )))
 
 
 # ── Private Helpers ───────────────────────────────────────────────────────────
 
+# One multiline pass over the raw response; matches the SUMMARY/CATEGORY/
+# BREAKING markers and bullet lines without materializing a line list.
+_RESP_RE = re.compile(
+    r"^[ \t]*(?:(?P<summary_kw>SUMMARY:).*?"
+    r"|(?P<cat_kw>CATEGORY:)[ \t]*(?P<category>.*?)"
+    r"|(?P<brk_kw>BREAKING:)[ \t]*(?P<breaking>.*?)"
+    r"|(?P<bullet>•.*?))[ \t\r]*$",
+    re.M
+)
+
+
 def _parse_ai_response(raw: str, fallback_title: str = "") -> dict:
     """Parse structured Gemini response into a clean dict."""
     result = {
@@ -204,24 +307,21 @@ def _parse_ai_response(raw: str, fallback_title: str = "") -> dict:
     if not raw:
         return result
 
-    lines = raw.split("\n")
     summary_lines = []
     in_summary = False
 
-    for line in lines:
-        line = line.strip()
-        if line.startswith("SUMMARY:"):
+    for m in _RESP_RE.finditer(raw):
+        if m.group("summary_kw"):
             in_summary = True
-        elif line.startswith("CATEGORY:"):
+        elif m.group("cat_kw"):
             in_summary = False
-            cat = line.replace("CATEGORY:", "").strip()
+            cat = m.group("category")
             result["category"] = cat if cat else "World News"
-        elif line.startswith("BREAKING:"):
+        elif m.group("brk_kw"):
             in_summary = False
-            val = line.replace("BREAKING:", "").strip().lower()
-            result["is_breaking"] = val == "true"
-        elif in_summary and line.startswith("•"):
-            summary_lines.append(line)
+            result["is_breaking"] = m.group("breaking").lower() == "true"
+        elif in_summary:
+            summary_lines.append(m.group("bullet"))
 
     if summary_lines:
         result["summary"] = "\n".join(summary_lines)
@@ -5,31 +5,56 @@ Builds nicely formatted Telegram messages from processed items.
 Uses Telegram's MarkdownV2 formatting.
 """
 
+import functools
+import io
 from datetime import datetime
 from config.settings import NEWS_CATEGORIES
 
+# Everything MarkdownV2 treats as markup, plus backslash itself.
+_MD_SPECIAL = '\\_*[]()~`>#+-=|{}.!'
+_MD_TABLE = str.maketrans({c: '\\' + c for c in _MD_SPECIAL})
+_MD_SPECIAL_SET = frozenset(_MD_SPECIAL)
+
+_BANNER = "=" * 30
+
+
+def _first_line(s: str, n: int = 120) -> str:
+    """First line of s, capped at n chars, without building a split list."""
+    i = s.find("\n")
+    return (s if i < 0 else s[:i])[:n]
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_md_cached(text: str) -> str:
+    # Most titles/summaries contain no specials at all; skip the copy.
+    if _MD_SPECIAL_SET.isdisjoint(text):
+        return text
+    return text.translate(_MD_TABLE)
+
 
 def escape_md(text: str) -> str:
-    """Escape ALL special characters for Telegram MarkdownV2."""
-    special = ['\\', '_', '*', '[', ']', '(', ')', '~', '`', '>',
-               '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    result = str(text)
-    for c in special:
-        result = result.replace(c, f'\\{c}')
-    return result
+    """Escape ALL special characters for Telegram MarkdownV2.
+
+    Memoized: category labels, source and channel names repeat in every
+    message, so the hot set resolves to a dict hit with no scan at all.
+    """
+    return _escape_md_cached(str(text))
 
 
 def format_breaking_news(item: dict) -> str:
     """Format a single breaking news item."""
-    title = escape_md(item.get("title", "Breaking News"))
-    summary = escape_md(item.get("ai_summary", ""))
+    # Slice before escaping so the translate pass sees a bounded input;
+    # the message is capped at 4096 chars by Telegram anyway.
+    title = escape_md(item.get("title", "Breaking News")[:200])
+    summary = escape_md(item.get("ai_summary", "")[:500])
     url = item.get("url", "")
-    source = escape_md(item.get("source", item.get("channel", "Unknown")))
+    source = escape_md(item.get("source", item.get("channel", "Unknown"))[:100])
+    # %H:%M contains no MarkdownV2 specials; no escape needed.
     timestamp = datetime.now().strftime("%H:%M")
 
     return (
         f"🚨 *BREAKING NEWS* 🚨\n"
-        f"🕐 {escape_md(timestamp)}\n\n"
+        f"🕐 {timestamp}\n\n"
         f"*{title}*\n\n"
         f"{summary}\n\n"
         f"📡 Source: {source}\n"
@@ -39,9 +64,9 @@ def format_breaking_news(item: dict) -> str:
 
 def format_youtube_update(item: dict) -> str:
     """Format a new YouTube video notification."""
-    title = escape_md(item.get("title", "New Video"))
-    channel = escape_md(item.get("channel", "Unknown Channel"))
-    summary = escape_md(item.get("ai_summary", ""))
+    title = escape_md(item.get("title", "New Video")[:200])
+    channel = escape_md(item.get("channel", "Unknown Channel")[:100])
+    summary = escape_md(item.get("ai_summary", "")[:500])
     url = item.get("url", "")
     category = escape_md(item.get("category", "General"))
 
@@ -69,37 +94,40 @@ def format_evening_digest(items: list[dict]) -> list[str]:
         cat = item.get("category", "World News")
         categories.setdefault(cat, []).append(item)
 
-    date_str = escape_md(datetime.now().strftime("%A, %d %B %Y"))
+    # Weekday/month names and digits carry no MarkdownV2 specials.
+    date_str = datetime.now().strftime("%A, %d %B %Y")
     messages = []
-    current_msg = f"📰 *PULSE AGENT — EVENING DIGEST*\n{date_str}\n{'=' * 30}\n\n"
+    # One growable buffer per outgoing message — StringIO grows
+    # geometrically and buf.tell() reads the current length in O(1),
+    # where repeated str += recopies the whole message each append.
+    buf = io.StringIO()
+    buf.write(f"📰 *PULSE AGENT — EVENING DIGEST*\n{date_str}\n{_BANNER}\n\n")
 
     for category, cat_items in sorted(categories.items()):
-        section = f"🏷️ *{escape_md(category)}*\n"
+        section_parts = [f"🏷️ *{escape_md(category)}*\n"]
 
         for item in cat_items[:3]:  # Max 3 items per category in digest
             title = escape_md(item.get("title", "")[:80])
-            summary_first_line = escape_md(
-                item.get("ai_summary", "").split("\n")[0][:120]
-            )
+            summary_first_line = escape_md(_first_line(item.get("ai_summary", "")))
             url = item.get("url", "")
-            section += f"\n• *{title}*\n  {summary_first_line}\n  🔗 [Read more]({url})\n"
+            section_parts.append(f"\n• *{title}*\n  {summary_first_line}\n  🔗 [Read more]({url})\n")
 
-        section += "\n"
+        section_parts.append("\n")
+        section = "".join(section_parts)
 
         # Telegram max message length safety check
-        if len(current_msg) + len(section) > 3800:
-            messages.append(current_msg)
-            current_msg = section
-        else:
-            current_msg += section
+        if buf.tell() + len(section) > 3800:
+            messages.append(buf.getvalue())
+            buf = io.StringIO()
+        buf.write(section)
 
-    messages.append(current_msg)
+    messages.append(buf.getvalue())
     return messages
 
 
 def format_morning_market_digest(items: list[dict]) -> str:
     """Format the morning stock & market digest."""
-    date_str = escape_md(datetime.now().strftime("%A, %d %B %Y"))
+    date_str = datetime.now().strftime("%A, %d %B %Y")
 
     if not items:
         return (
@@ -107,21 +135,21 @@ def format_morning_market_digest(items: list[dict]) -> str:
             f"No market updates collected\\. Markets may be closed today\\."
         )
 
-    msg = f"📈 *MORNING MARKET BRIEFING*\n{date_str}\n{'=' * 30}\n\n"
-    for item in items[:5]:
-        title = escape_md(item.get("title", "")[:80])
-        summary = escape_md(item.get("ai_summary", "").split("\n")[0][:120])
-        url = item.get("url", "")
-        msg += f"• *{title}*\n  {summary}\n  🔗 [More]({url})\n\n"
-
-    return msg
+    lines = [
+        f"• *{escape_md(item.get('title', '')[:80])}*\n"
+        f"  {escape_md(_first_line(item.get('ai_summary', '')))}\n"
+        f"  🔗 [More]({item.get('url', '')})\n\n"
+        for item in items[:5]
+    ]
+    return f"📈 *MORNING MARKET BRIEFING*\n{date_str}\n{_BANNER}\n\n" + "".join(lines)
 
 
 def format_category_update(category: str, content: str) -> str:
     """Format an on-demand category update requested by user."""
     cat_escaped = escape_md(category)
-    content_escaped = escape_md(content)
-    timestamp = escape_md(datetime.now().strftime("%H:%M, %d %b"))
+    # Bounded so header + content stays under Telegram's 4096-char cap.
+    content_escaped = escape_md(content[:3500])
+    timestamp = datetime.now().strftime("%H:%M, %d %b")  # no specials
 
     return (
         f"🔍 *Category Update: {cat_escaped}*\n"
@@ -8,6 +8,7 @@ All scheduled job functions:
   - run_youtube_monitor()      → every 60 minutes
 """
 
+import asyncio
 import logging
 from src.scrapers.youtube_scraper import fetch_new_youtube_videos
 from src.scrapers.news_scraper import (
@@ -20,9 +21,12 @@ from src.processors.message_formatter import (
     format_evening_digest, format_morning_market_digest
 )
 from src.database.db import (
-    is_already_sent, mark_as_sent, add_to_digest_queue,
+    is_already_sent, mark_as_sent, mark_as_sent_bulk, add_many_to_digest_queue,
     get_unsent_digest_items, mark_digest_items_sent, clear_old_digest
 )
+# Safe at module top: telegram_bot only imports this module lazily inside
+# its callback handler, so there is no import cycle left to dodge.
+from src.bot.telegram_bot import send_message_to_all_users, _rows_to_digest_items
 
 logger = logging.getLogger(__name__)
 
@@ -34,26 +38,29 @@ async def run_breaking_news_check() -> int:
     Fetches and sends breaking news immediately.
     Returns count of breaking news items sent.
     """
-    from src.bot.telegram_bot import send_message_to_all_users
-
     logger.info("🚨 Running breaking news check...")
-    candidates = fetch_breaking_news_candidates()
+    # Scrapers block on HTTP; run them off the event loop so Telegram
+    # handlers and other jobs keep servicing meanwhile.
+    candidates = await asyncio.to_thread(fetch_breaking_news_candidates)
 
     if not candidates:
         return 0
 
-    processed = batch_summarize(candidates, source_type="news")
-    sent_count = 0
+    processed = await batch_summarize(candidates, source_type="news")
 
+    # Format and record everything first; fan out to users afterwards so
+    # the broadcast loop is pure sends.
+    alerts = []
     for item in processed:
         if item.get("is_breaking") and not is_already_sent(item["id"]):
-            msg = format_breaking_news(item)
-            await send_message_to_all_users(msg)
+            alerts.append(format_breaking_news(item))
             mark_as_sent(item["id"], item["source_type"], item["title"], is_breaking=True)
-            sent_count += 1
 
-    logger.info(f"🚨 Sent {sent_count} breaking news alerts.")
-    return sent_count
+    for msg in alerts:
+        await send_message_to_all_users(msg)
+
+    logger.info(f"🚨 Sent {len(alerts)} breaking news alerts.")
+    return len(alerts)
 
 
 # ── YouTube Monitor (every 60 min) ───────────────────────────────────────────
@@ -61,32 +68,34 @@ async def run_breaking_news_check() -> int:
 async def run_youtube_monitor():
     """Check YouTube channels for new videos and add to digest queue."""
     logger.info("📺 Running YouTube monitor...")
-    new_videos = fetch_new_youtube_videos()
+    new_videos = await asyncio.to_thread(fetch_new_youtube_videos)
 
     if not new_videos:
         logger.info("📺 No new YouTube videos.")
         return
 
-    processed = batch_summarize(new_videos, source_type="youtube")
+    processed = await batch_summarize(new_videos, source_type="youtube")
 
+    queue_rows, sent_rows, alerts = [], [], []
     for item in processed:
         # If breaking/urgent, send immediately
         if item.get("is_breaking"):
-            from src.bot.telegram_bot import send_message_to_all_users
-            msg = format_youtube_update(item)
-            await send_message_to_all_users(msg)
+            alerts.append(format_youtube_update(item))
             mark_as_sent(item["id"], "youtube", item["title"], is_breaking=True)
         else:
-            # Add to evening digest queue
-            add_to_digest_queue(
-                item_id=item["id"],
-                title=item["title"],
-                summary=item["ai_summary"],
-                category=item["category"],
-                source_url=item["url"],
-                source_type="youtube"
-            )
-            mark_as_sent(item["id"], "youtube", item["title"])
+            # Queue for the evening digest; written in one batch below
+            queue_rows.append((
+                item["id"], item["title"], item["ai_summary"],
+                item["category"], item["url"], "youtube"
+            ))
+            sent_rows.append((item["id"], "youtube", item["title"]))
+
+    add_many_to_digest_queue(queue_rows)
+    mark_as_sent_bulk(sent_rows)
+
+    if alerts:
+        for msg in alerts:
+            await send_message_to_all_users(msg)
 
 
 # ── News Collector (every 60 min, feeds digest) ───────────────────────────────
@@ -95,33 +104,45 @@ async def run_news_collector():
     """Collect all news and RSS articles into the digest queue."""
     logger.info("📰 Collecting news articles...")
 
-    # Combine RSS + NewsAPI
-    rss_items = fetch_rss_articles()
-    news_items = fetch_all_category_news()
+    # Combine RSS + NewsAPI, fetched side by side off the event loop
+    rss_items, news_items = await asyncio.gather(
+        asyncio.to_thread(fetch_rss_articles),
+        asyncio.to_thread(fetch_all_category_news)
+    )
     all_items = rss_items + news_items
 
+    # The same story often arrives via both an RSS feed and NewsAPI;
+    # drop URL duplicates before paying for summarization twice.
+    seen_urls = set()
+    all_items = [
+        item for item in all_items
+        if item["url"] not in seen_urls and not seen_urls.add(item["url"])
+    ]
+
     if not all_items:
         return
 
-    processed = batch_summarize(all_items, source_type="news")
+    processed = await batch_summarize(all_items, source_type="news")
 
+    queue_rows, sent_rows, alerts = [], [], []
     for item in processed:
         if item.get("is_breaking"):
-            from src.bot.telegram_bot import send_message_to_all_users
-            from src.processors.message_formatter import format_breaking_news
-            msg = format_breaking_news(item)
-            await send_message_to_all_users(msg)
+            alerts.append(format_breaking_news(item))
             mark_as_sent(item["id"], item["source_type"], item["title"], is_breaking=True)
         else:
-            add_to_digest_queue(
-                item_id=item["id"],
-                title=item["title"],
-                summary=item.get("ai_summary", ""),
-                category=item.get("category", "World News"),
-                source_url=item.get("url", ""),
-                source_type=item["source_type"]
-            )
-            mark_as_sent(item["id"], item["source_type"], item["title"])
+            queue_rows.append((
+                item["id"], item["title"], item.get("ai_summary", ""),
+                item.get("category", "World News"), item.get("url", ""),
+                item["source_type"]
+            ))
+            sent_rows.append((item["id"], item["source_type"], item["title"]))
+
+    add_many_to_digest_queue(queue_rows)
+    mark_as_sent_bulk(sent_rows)
+
+    if alerts:
+        for msg in alerts:
+            await send_message_to_all_users(msg)
 
     logger.info(f"📰 Collected {len(processed)} news items into queue.")
 
@@ -130,16 +151,14 @@ async def run_news_collector():
 
 async def run_evening_digest():
     """Send the full evening digest to all users."""
-    from src.bot.telegram_bot import send_message_to_all_users
-
     logger.info("🌙 Sending evening digest...")
 
     items = get_unsent_digest_items()
 
     # Filter out market items (they go in morning digest)
-    evening_items = [i for i in items if i.get("category", "") != "Stock & Market"]
+    evening_items = [i for i in items if (i["category"] or "") != "Stock & Market"]
 
-    messages = format_evening_digest(evening_items)
+    messages = format_evening_digest(_rows_to_digest_items(evening_items))
     for msg in messages:
         await send_message_to_all_users(msg)
 
@@ -156,14 +175,12 @@ async def run_evening_digest():
 
 async def run_morning_market():
     """Send stock & market briefing each morning."""
-    from src.bot.telegram_bot import send_message_to_all_users
-
     logger.info("☀️ Sending morning market briefing...")
 
     # Fetch fresh market news
-    market_articles = fetch_news_by_category("business")
+    market_articles = await asyncio.to_thread(fetch_news_by_category, "business")
     if market_articles:
-        processed = batch_summarize(market_articles, source_type="news")
+        processed = await batch_summarize(market_articles, source_type="news")
         for item in processed:
             mark_as_sent(item["id"], "news", item["title"])
     else:
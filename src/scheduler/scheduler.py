@@ -13,7 +13,7 @@ from telegram.ext import Application # type: ignore
 from config.settings import (
     EVENING_DIGEST_HOUR, EVENING_DIGEST_MINUTE,
     MORNING_MARKET_HOUR, MORNING_MARKET_MINUTE,
-    BREAKING_NEWS_INTERVAL_MIN
+    BREAKING_NEWS_INTERVAL_MIN, NEWS_FETCH_INTERVAL_MIN
 )
 
 logger = logging.getLogger(__name__)
@@ -42,7 +42,7 @@ def attach_scheduler(app: Application):
     )
     scheduler.add_job(
         run_news_collector,
-        trigger=IntervalTrigger(minutes=60, start_date="2024-01-01 00:30:00"),
+        trigger=IntervalTrigger(minutes=NEWS_FETCH_INTERVAL_MIN),
         id="news_collector", name="News Collector", replace_existing=True
     )
     scheduler.add_job(
@@ -50,12 +50,6 @@ def attach_scheduler(app: Application):
         trigger=CronTrigger(hour=EVENING_DIGEST_HOUR, minute=EVENING_DIGEST_MINUTE),
         id="evening_digest", name="Evening Digest", replace_existing=True
     )
-    from config.settings import NEWS_FETCH_INTERVAL_MIN
-    scheduler.add_job(
-        run_news_collector,
-        trigger=IntervalTrigger(minutes=NEWS_FETCH_INTERVAL_MIN),
-        id="news_collector", name="News Collector", replace_existing=True
-    )
 
     async def on_startup(application: Application):
         scheduler.start()
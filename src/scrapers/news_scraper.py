@@ -9,46 +9,77 @@ Fetches articles from:
 import feedparser # type: ignore
 import requests # type: ignore
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from config.settings import CUSTOM_RSS_FEEDS, NEWS_API_KEY, BREAKING_KEYWORDS
-from src.database.db import is_already_sent
+from src.database.db import which_already_sent, get_feed_cache, set_feed_cache
 
 logger = logging.getLogger(__name__)
 NEWSAPI_ENDPOINT = "https://newsapi.org/v2/top-headlines"
 
+# All breaking keywords in one alternation: a single C-level scan of the
+# title replaces a lower() copy plus one substring search per keyword.
+_BREAKING_RE = re.compile("|".join(map(re.escape, BREAKING_KEYWORDS)), re.IGNORECASE)
+
+# One session for all NewsAPI traffic: keep-alive reuses the TLS
+# connection to newsapi.org instead of handshaking per request, and it
+# is safe to share across the fetch thread pool.
+_SESSION = requests.Session()
+
 
 # ── RSS Feed Scraper ──────────────────────────────────────────────────────────
 
-def fetch_rss_articles() -> list[dict]:
-    """Fetch new articles from custom RSS feeds."""
+def _fetch_one_rss_feed(feed_url: str) -> list[dict]:
+    """Fetch and filter one RSS feed; returns its new articles."""
     articles = []
+    try:
+        # Conditional GET: feedparser sends our stored validators and
+        # reports 304 when the feed body hasn't changed since last poll.
+        etag, modified = get_feed_cache(feed_url)
+        feed = feedparser.parse(feed_url, etag=etag, modified=modified)
+        if getattr(feed, "status", None) == 304:
+            return articles  # nothing new; skip the parse entirely
+        set_feed_cache(feed_url, getattr(feed, "etag", None), getattr(feed, "modified", None))
+        source_name = feed.feed.get("title", feed_url)
+
+        entries = feed.entries[:10]
+        # One membership lookup for the whole feed, then filter in Python.
+        seen = which_already_sent([e.get("link", "") for e in entries if e.get("link")])
+
+        for entry in entries:
+            url = entry.get("link", "")
+            title = entry.get("title", "")
+
+            if not url or url in seen:
+                continue
 
-    for feed_url in CUSTOM_RSS_FEEDS:
-        feed_url = feed_url.strip()
-        if not feed_url:
-            continue
+            articles.append({
+                "id": url,
+                "title": title,
+                "url": url,
+                "summary_hint": entry.get("summary", ""),
+                "source": source_name,
+                "source_type": "rss"
+            })
 
-        try:
-            feed = feedparser.parse(feed_url)
-            source_name = feed.feed.get("title", feed_url)
+    except Exception as e:
+        logger.error(f"RSS error for {feed_url}: {e}")
+    return articles
 
-            for entry in feed.entries[:10]:
-                url = entry.get("link", "")
-                title = entry.get("title", "")
 
-                if not url or is_already_sent(url):
-                    continue
+def fetch_rss_articles() -> list[dict]:
+    """Fetch new articles from custom RSS feeds.
 
-                articles.append({
-                    "id": url,
-                    "title": title,
-                    "url": url,
-                    "summary_hint": entry.get("summary", ""),
-                    "source": source_name,
-                    "source_type": "rss"
-                })
+    Feeds download in parallel — each parse is a blocking HTTP GET, so
+    wall time is the slowest feed instead of the sum of all of them.
+    """
+    articles = []
+    if not CUSTOM_RSS_FEEDS:
+        return articles
 
-        except Exception as e:
-            logger.error(f"RSS error for {feed_url}: {e}")
+    with ThreadPoolExecutor(max_workers=min(16, len(CUSTOM_RSS_FEEDS))) as ex:
+        for feed_articles in ex.map(_fetch_one_rss_feed, CUSTOM_RSS_FEEDS):
+            articles.extend(feed_articles)
 
     logger.info(f"📰 RSS: Found {len(articles)} new articles.")
     return articles
@@ -63,7 +94,7 @@ def fetch_news_by_category(category: str = "general", country: str = "in") -> li
         return []
 
     try:
-        resp = requests.get(NEWSAPI_ENDPOINT, params={
+        resp = _SESSION.get(NEWSAPI_ENDPOINT, params={
             "apiKey": NEWS_API_KEY,
             "category": category.lower(),
             "country": country,
@@ -73,10 +104,11 @@ def fetch_news_by_category(category: str = "general", country: str = "in") -> li
         articles_raw = resp.json().get("articles", [])
 
         articles = []
+        seen = which_already_sent([a.get("url", "") for a in articles_raw if a.get("url")])
         for art in articles_raw:
             url = art.get("url", "")
             title = art.get("title", "")
-            if not url or is_already_sent(url):
+            if not url or url in seen:
                 continue
             articles.append({
                 "id": url,
@@ -102,7 +134,7 @@ def fetch_breaking_news_candidates() -> list[dict]:
 
     results = []
     try:
-        resp = requests.get("https://newsapi.org/v2/everything", params={
+        resp = _SESSION.get("https://newsapi.org/v2/everything", params={
             "apiKey": NEWS_API_KEY,
             "q": " OR ".join(BREAKING_KEYWORDS[:6]),  # API limit
             "sortBy": "publishedAt",
@@ -111,15 +143,16 @@ def fetch_breaking_news_candidates() -> list[dict]:
         }, timeout=10)
         resp.raise_for_status()
 
-        for art in resp.json().get("articles", []):
+        articles_raw = resp.json().get("articles", [])
+        seen = which_already_sent([a.get("url", "") for a in articles_raw if a.get("url")])
+        for art in articles_raw:
             url = art.get("url", "")
             title = art.get("title", "")
-            if not url or is_already_sent(url):
+            if not url or url in seen:
                 continue
 
             # Only flag if title actually contains a breaking keyword
-            title_lower = title.lower()
-            if any(kw in title_lower for kw in BREAKING_KEYWORDS):
+            if _BREAKING_RE.search(title):
                 results.append({
                     "id": url,
                     "title": title,
@@ -138,10 +171,11 @@ def fetch_breaking_news_candidates() -> list[dict]:
 
 
 def fetch_all_category_news() -> list[dict]:
-    """Fetch news for all major NewsAPI categories."""
+    """Fetch news for all major NewsAPI categories concurrently."""
     api_categories = ["general", "technology", "sports", "entertainment",
                       "business", "health", "science"]
     all_articles = []
-    for cat in api_categories:
-        all_articles.extend(fetch_news_by_category(cat))
+    with ThreadPoolExecutor(max_workers=len(api_categories)) as ex:
+        for articles in ex.map(fetch_news_by_category, api_categories):
+            all_articles.extend(articles)
     return all_articles
\ No newline at end of file
@@ -5,55 +5,93 @@ Fetches new videos from YouTube channels via RSS feeds.
 No API key needed for basic RSS scraping!
 """
 
-import feedparser
 import logging
+import requests # type: ignore
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from lxml import etree # type: ignore
 from config.settings import YOUTUBE_CHANNEL_IDS
-from src.database.db import is_already_sent
+from src.database.db import which_already_sent, get_feed_cache, set_feed_cache
 
 logger = logging.getLogger(__name__)
 
 RSS_BASE = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
 
+# YouTube serves a fixed Atom schema, so lxml with qualified tag names
+# replaces feedparser's general-purpose dialect handling — much less
+# parse work per channel. Session keep-alive reuses the connection to
+# youtube.com across the channel fan-out.
+_SESSION = requests.Session()
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+
+
+def _fetch_one_channel(channel_id: str) -> list[dict]:
+    """Fetch one channel's RSS feed; returns its new videos."""
+    rss_url = RSS_BASE.format(channel_id=channel_id)
+    new_videos = []
+    try:
+        etag, last_modified = get_feed_cache(rss_url)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        resp = _SESSION.get(rss_url, timeout=10, headers=headers)
+        if resp.status_code == 304:
+            return new_videos  # unchanged since last poll; skip the parse
+        resp.raise_for_status()
+        set_feed_cache(rss_url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        root = etree.fromstring(resp.content)
+        channel_name = root.findtext(f"{_ATOM}title") or channel_id
+
+        entries = root.findall(f"{_ATOM}entry")[:5]  # Only check latest 5 videos
+        candidates = [
+            (entry,
+             f"https://www.youtube.com/watch?v="
+             f"{entry.findtext(f'{_YT}videoId') or entry.findtext(f'{_ATOM}id') or ''}")
+            for entry in entries
+        ]
+        # One membership lookup for the whole channel batch.
+        seen = which_already_sent([url for _, url in candidates])
+
+        for entry, video_url in candidates:
+            title = entry.findtext(f"{_ATOM}title") or "Untitled"
+
+            if video_url in seen:
+                continue
+
+            new_videos.append({
+                "id": video_url,
+                "title": title,
+                "url": video_url,
+                "channel": channel_name,
+                "published": entry.findtext(f"{_ATOM}published") or "",
+                "source_type": "youtube"
+            })
+
+        logger.debug(f"Checked channel: {channel_name}")
+
+    except Exception as e:
+        logger.error(f"Error fetching YouTube RSS for {channel_id}: {e}")
+    return new_videos
+
 
 def fetch_new_youtube_videos() -> list[dict]:
     """
     Returns list of new (unseen) videos from subscribed channels.
     Each item: {id, title, url, channel, published}
+
+    Channels are fetched in parallel so wall time tracks the slowest
+    feed rather than the sum of all of them.
     """
     new_videos = []
+    if not YOUTUBE_CHANNEL_IDS:
+        return new_videos
 
-    for channel_id in YOUTUBE_CHANNEL_IDS:
-        channel_id = channel_id.strip()
-        if not channel_id:
-            continue
-
-        rss_url = RSS_BASE.format(channel_id=channel_id)
-        try:
-            feed = feedparser.parse(rss_url)
-            channel_name = feed.feed.get("title", channel_id)
-
-            for entry in feed.entries[:5]:  # Only check latest 5 videos
-                video_id = entry.get("yt_videoid", entry.get("id", ""))
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                title = entry.get("title", "Untitled")
-
-                if is_already_sent(video_url):
-                    continue
-
-                new_videos.append({
-                    "id": video_url,
-                    "title": title,
-                    "url": video_url,
-                    "channel": channel_name,
-                    "published": entry.get("published", ""),
-                    "source_type": "youtube"
-                })
-
-            logger.debug(f"Checked channel: {channel_name}")
-
-        except Exception as e:
-            logger.error(f"Error fetching YouTube RSS for {channel_id}: {e}")
+    with ThreadPoolExecutor(max_workers=min(16, len(YOUTUBE_CHANNEL_IDS))) as ex:
+        for channel_videos in ex.map(_fetch_one_channel, YOUTUBE_CHANNEL_IDS):
+            new_videos.extend(channel_videos)
 
     logger.info(f"📺 YouTube: Found {len(new_videos)} new videos.")
     return new_videos